@@ -1,5 +1,12 @@
 """Test titiler.application.main.app."""
 
+import pytest
+from anyio import to_thread
+from pydantic import ValidationError
+from starlette.testclient import TestClient
+
+from titiler.application.settings import ApiSettings
+
 
 def test_health(app):
     """Test /healthz endpoint."""
@@ -12,3 +19,24 @@ def test_health(app):
 
     response = app.get("/api.html")
     assert response.status_code == 200
+
+
+def test_threadpool_size(monkeypatch):
+    """Test the threadpool size is set on startup."""
+    from titiler.application import main
+
+    monkeypatch.setattr(main.api_settings, "threadpool_size", 10)
+    with TestClient(main.app) as client:
+        limiter = client.portal.call(to_thread.current_default_thread_limiter)
+        assert limiter.total_tokens == 10
+
+
+def test_threadpool_size_validation(monkeypatch):
+    """Test invalid threadpool size."""
+    monkeypatch.setenv("TITILER_API_THREADPOOL_SIZE", "0")
+    with pytest.raises(ValidationError):
+        ApiSettings()
+
+    monkeypatch.setenv("TITILER_API_THREADPOOL_SIZE", "-1")
+    with pytest.raises(ValidationError):
+        ApiSettings()
@@ -1,8 +1,10 @@
 """titiler app."""
 
 import logging
+from contextlib import asynccontextmanager
 
 import jinja2
+from anyio import to_thread
 from fastapi import FastAPI
 from rio_tiler.io import STACReader
 from starlette.middleware.cors import CORSMiddleware
@@ -42,11 +44,25 @@ logging.getLogger("rio-tiler").setLevel(logging.ERROR)
 templates = Jinja2Templates(
     directory="",
     loader=jinja2.ChoiceLoader([jinja2.PackageLoader(__package__, "templates")]),
+    auto_reload=False,
 )  # type:ignore
 
 
 api_settings = ApiSettings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """FastAPI Lifespan."""
+    # Sync endpoints (e.g /tiles) are run in AnyIO's default threadpool (40 threads),
+    # which limits the number of concurrent requests a worker can process.
+    if api_settings.threadpool_size is not None:
+        limiter = to_thread.current_default_thread_limiter()
+        limiter.total_tokens = api_settings.threadpool_size
+
+    yield
+
+
 app = FastAPI(
     title=api_settings.name,
     openapi_url="/api",
@@ -63,6 +79,7 @@ app = FastAPI(
     """,
     version=titiler_version,
     root_path=api_settings.root_path,
+    lifespan=lifespan,
 )
 
 ###############################################################################
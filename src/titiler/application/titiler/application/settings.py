@@ -1,6 +1,8 @@
 """Titiler API settings."""
 
-from pydantic import field_validator
+from typing import Optional
+
+from pydantic import PositiveInt, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -19,6 +21,9 @@ class ApiSettings(BaseSettings):
 
     lower_case_query_parameters: bool = False
 
+    # Number of worker threads used by FastAPI/starlette to run sync endpoints
+    threadpool_size: Optional[PositiveInt] = None
+
     model_config = SettingsConfigDict(env_prefix="TITILER_API_", env_file=".env")
 
     @field_validator("cors_origins")
@@ -2,6 +2,7 @@
 
 import abc
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type, Union
 from urllib.parse import urlencode
 
@@ -69,6 +70,8 @@ from titiler.core.routing import EndpointScope
 DEFAULT_TEMPLATES = Jinja2Templates(
     directory="",
     loader=jinja2.ChoiceLoader([jinja2.PackageLoader(__package__, "templates")]),
+    # packaged templates do not change at runtime, skip the `stat` done on each render
+    auto_reload=False,
 )  # type:ignore
 
 
@@ -762,6 +765,30 @@ class TilerFactory(BaseTilerFactory):
     def wmts(self):  # noqa: C901
         """Register /wmts endpoint."""
 
+        @lru_cache(maxsize=64)
+        def _tile_matrices(
+            tileMatrixSetId: str, minzoom: int, maxzoom: int
+        ) -> Tuple[str, ...]:
+            """Return the WMTS TileMatrix elements for a TileMatrixSet and a zoom range."""
+            tms = self.supported_tms.get(tileMatrixSetId)
+
+            tileMatrix = []
+            for zoom in range(minzoom, maxzoom + 1):
+                matrix = tms.matrix(zoom)
+                tm = f"""
+                        <TileMatrix>
+                            <ows:Identifier>{matrix.id}</ows:Identifier>
+                            <ScaleDenominator>{matrix.scaleDenominator}</ScaleDenominator>
+                            <TopLeftCorner>{matrix.pointOfOrigin[0]} {matrix.pointOfOrigin[1]}</TopLeftCorner>
+                            <TileWidth>{matrix.tileWidth}</TileWidth>
+                            <TileHeight>{matrix.tileHeight}</TileHeight>
+                            <MatrixWidth>{matrix.matrixWidth}</MatrixWidth>
+                            <MatrixHeight>{matrix.matrixHeight}</MatrixHeight>
+                        </TileMatrix>"""
+                tileMatrix.append(tm)
+
+            return tuple(tileMatrix)
+
         @self.router.get("/WMTSCapabilities.xml", response_class=XMLResponse)
         @self.router.get(
             "/{tileMatrixSetId}/WMTSCapabilities.xml", response_class=XMLResponse
@@ -850,20 +877,7 @@ class TilerFactory(BaseTilerFactory):
                     minzoom = minzoom if minzoom is not None else src_dst.minzoom
                     maxzoom = maxzoom if maxzoom is not None else src_dst.maxzoom
 
-            tileMatrix = []
-            for zoom in range(minzoom, maxzoom + 1):
-                matrix = tms.matrix(zoom)
-                tm = f"""
-                        <TileMatrix>
-                            <ows:Identifier>{matrix.id}</ows:Identifier>
-                            <ScaleDenominator>{matrix.scaleDenominator}</ScaleDenominator>
-                            <TopLeftCorner>{matrix.pointOfOrigin[0]} {matrix.pointOfOrigin[1]}</TopLeftCorner>
-                            <TileWidth>{matrix.tileWidth}</TileWidth>
-                            <TileHeight>{matrix.tileHeight}</TileHeight>
-                            <MatrixWidth>{matrix.matrixWidth}</MatrixWidth>
-                            <MatrixHeight>{matrix.matrixHeight}</MatrixHeight>
-                        </TileMatrix>"""
-                tileMatrix.append(tm)
+            tileMatrix = _tile_matrices(tileMatrixSetId, minzoom, maxzoom)
 
             return self.templates.TemplateResponse(
                 "wmts.xml",
@@ -33,6 +33,7 @@ class CacheControlMiddleware:
         self.cachecontrol = cachecontrol
         self.cachecontrol_max_http_code = cachecontrol_max_http_code
         self.exclude_path = exclude_path or set()
+        self._exclude_path_regex = [re.compile(path) for path in self.exclude_path]
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send):
         """Handle call."""
@@ -49,10 +50,8 @@ class CacheControlMiddleware:
                         scope["method"] in ["HEAD", "GET"]
                         and message["status"] < self.cachecontrol_max_http_code
                         and not any(
-                            [
-                                re.match(path, scope["path"])
-                                for path in self.exclude_path
-                            ]
+                            regex.match(scope["path"])
+                            for regex in self._exclude_path_regex
                         )
                     ):
                         response_headers["Cache-Control"] = self.cachecontrol
@@ -12,6 +12,7 @@ from titiler.core.factory import BaseTilerFactory, FactoryExtension
 DEFAULT_TEMPLATES = Jinja2Templates(
     directory="",
     loader=jinja2.ChoiceLoader([jinja2.PackageLoader(__package__, "templates")]),
+    auto_reload=False,
 )  # type:ignore
 
 
@@ -24,6 +24,7 @@ from titiler.core.resources.enums import ImageType, MediaType
 DEFAULT_TEMPLATES = Jinja2Templates(
     directory="",
     loader=jinja2.ChoiceLoader([jinja2.PackageLoader(__package__, "templates")]),
+    auto_reload=False,
 )  # type:ignore
 
 
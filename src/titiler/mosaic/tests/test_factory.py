@@ -10,11 +10,15 @@ import numpy
 from cogeo_mosaic.backends import FileBackend
 from cogeo_mosaic.mosaic import MosaicJSON
 from fastapi import FastAPI
+from morecantile import tms
 from rio_tiler.mosaic.methods import PixelSelectionMethod
 from starlette.testclient import TestClient
 
 from titiler.core.dependencies import DefaultDependency
+from titiler.core.errors import DEFAULT_STATUS_CODES, add_exception_handlers
 from titiler.core.resources.enums import OptionalHeader
+from titiler.mosaic import factory
+from titiler.mosaic.errors import MOSAIC_STATUS_CODES
 from titiler.mosaic.factory import MosaicTilerFactory
 
 from .conftest import DATA_DIR
@@ -47,6 +51,8 @@ def test_MosaicTilerFactory():
 
     app = FastAPI()
     app.include_router(mosaic.router, prefix="/mosaic")
+    add_exception_handlers(app, DEFAULT_STATUS_CODES)
+    add_exception_handlers(app, MOSAIC_STATUS_CODES)
     client = TestClient(app)
 
     response = client.get("/openapi.json")
@@ -61,7 +67,9 @@ def test_MosaicTilerFactory():
             params={"url": mosaic_file},
         )
         assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
         assert response.json()["mosaicjson"]
+        assert MosaicJSON.model_validate(response.json())
 
         response = client.get(
             "/mosaic",
@@ -106,8 +114,55 @@ def test_MosaicTilerFactory():
 
         response = client.get("/mosaic/tiles/7/37/45", params={"url": mosaic_file})
         assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
         assert response.headers["X-Assets"]
 
+        # Tile fully covered by the mosaic's assets
+        response = client.get("/mosaic/tiles/9/150/182", params={"url": mosaic_file})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/jpeg"
+
+        # ETag / If-None-Match
+        response = client.get("/mosaic/tiles/7/37/45", params={"url": mosaic_file})
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        response = client.get(
+            "/mosaic/tiles/7/37/45",
+            params={"url": mosaic_file},
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert not response.content
+
+        response = client.get(
+            "/mosaic/tiles/7/37/45",
+            params={"url": mosaic_file, "rescale": "0,1000"},
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+        response = client.get(
+            "/mosaic/tiles/7/37/45",
+            params={"url": mosaic_file},
+            headers={"If-None-Match": "*"},
+        )
+        assert response.status_code == 304
+
+        # No ETag for tiles without assets
+        response = client.get("/mosaic/tiles/7/0/0", params={"url": mosaic_file})
+        assert response.status_code == 404
+        assert "ETag" not in response.headers
+
+        response = client.get(
+            "/mosaic/tiles/7/0/0",
+            params={"url": mosaic_file},
+            headers={"If-None-Match": "*"},
+        )
+        assert response.status_code == 404
+
         response = client.get(
             "/mosaic/tiles/WebMercatorQuad/7/37/45", params={"url": mosaic_file}
         )
@@ -316,7 +371,7 @@ def test_MosaicTilerFactory_PixelSelectionParams():
 
 def test_MosaicTilerFactory_strict_zoom(monkeypatch):
     """Test MosaicTilerFactory factory with STRICT Zoom Mode"""
-    monkeypatch.setenv("MOSAIC_STRICT_ZOOM", "TRUE")
+    monkeypatch.setattr(factory, "MOSAIC_STRICT_ZOOM", True)
 
     mosaic = MosaicTilerFactory()
     app = FastAPI()
@@ -334,3 +389,50 @@ def test_MosaicTilerFactory_strict_zoom(monkeypatch):
             response = client.get("/tiles/11/594/734.png", params={"url": mosaic_file})
             assert response.status_code == 400
             assert "Invalid ZOOM level 11" in response.text
+
+
+def test_tile_assets():
+    """Test _tile_assets helper."""
+    with tmpmosaic() as mosaic_file:
+        with FileBackend(mosaic_file) as src_dst:
+            assert len(factory._tile_assets(src_dst, 37, 45, 7)) == 2
+            assert len(factory._tile_assets(src_dst, 36, 45, 7)) == 1
+            assert factory._tile_assets(src_dst, 0, 0, 7) == []
+            # higher zoom: assets of the parent quadkey
+            assert len(factory._tile_assets(src_dst, 150, 182, 9)) == 2
+
+            # zoom lower than the mosaic's quadkey zoom
+            assert factory._tile_assets(src_dst, 18, 22, 6) is None
+
+        # TMS different from the mosaic's TMS
+        with FileBackend(mosaic_file, tms=tms.get("WGS1984Quad")) as src_dst:
+            assert factory._tile_assets(src_dst, 148, 61, 8) is None
+
+        # tiles not stored in the mosaic document (e.g DynamoDB, SQLite)
+        with FileBackend(mosaic_file) as src_dst:
+            src_dst.mosaic_def.tiles = {}
+            assert factory._tile_assets(src_dst, 37, 45, 7) is None
+
+
+def test_MosaicTilerFactory_tile_threads():
+    """Make sure no ThreadPool is used for single asset tiles."""
+    threads = []
+
+    class Backend(FileBackend):
+        def tile(self, *args, **kwargs):
+            threads.append(kwargs["threads"])
+            return super().tile(*args, **kwargs)
+
+    mosaic = MosaicTilerFactory(reader=Backend)
+    app = FastAPI()
+    app.include_router(mosaic.router)
+    client = TestClient(app)
+
+    with tmpmosaic() as mosaic_file:
+        response = client.get("/tiles/7/36/45.png", params={"url": mosaic_file})
+        assert response.status_code == 200
+
+        response = client.get("/tiles/7/37/45.png", params={"url": mosaic_file})
+        assert response.status_code == 200
+
+    assert threads == [0, factory.MOSAIC_THREADS]
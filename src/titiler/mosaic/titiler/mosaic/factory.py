@@ -1,10 +1,13 @@
 """TiTiler.mosaic Router factories."""
 
+import hashlib
 import os
 from dataclasses import dataclass
-from typing import Callable, Dict, Literal, Optional, Type, Union
+from functools import lru_cache
+from typing import Callable, Dict, List, Literal, Optional, Sequence, Tuple, Type, Union
 from urllib.parse import urlencode
 
+import numpy
 import rasterio
 from cogeo_mosaic.backends import BaseBackend, MosaicBackend
 from cogeo_mosaic.models import Info as mosaicInfo
@@ -12,10 +15,11 @@ from cogeo_mosaic.mosaic import MosaicJSON
 from fastapi import Depends, HTTPException, Path, Query
 from geojson_pydantic.features import Feature
 from geojson_pydantic.geometries import Polygon
+from morecantile import Tile
 from morecantile import tms as morecantile_tms
 from morecantile.defaults import TileMatrixSets
 from pydantic import conint
-from rio_tiler.constants import MAX_THREADS, WGS84_CRS
+from rio_tiler.constants import MAX_THREADS, WEB_MERCATOR_TMS, WGS84_CRS
 from rio_tiler.io import BaseReader, MultiBandReader, MultiBaseReader, Reader
 from rio_tiler.models import Bounds
 from rio_tiler.mosaic.methods import PixelSelectionMethod
@@ -31,6 +35,12 @@ from titiler.core.resources.enums import ImageType, MediaType, OptionalHeader
 from titiler.core.resources.responses import GeoJSONResponse, JSONResponse, XMLResponse
 from titiler.mosaic.models.responses import Point
 
+MOSAIC_THREADS = int(os.getenv("MOSAIC_CONCURRENCY", MAX_THREADS))
+MOSAIC_STRICT_ZOOM = str(os.getenv("MOSAIC_STRICT_ZOOM", False)).lower() in [
+    "true",
+    "yes",
+]
+
 
 def PixelSelectionParams(
     pixel_selection: Annotated[  # type: ignore
@@ -44,6 +54,46 @@ def PixelSelectionParams(
     return PixelSelectionMethod[pixel_selection].value()
 
 
+def _tile_assets(src_dst: BaseBackend, x: int, y: int, z: int) -> Optional[List[str]]:
+    """Return the assets for a tile, when they can be found directly in the mosaic definition.
+
+    Note: `None` is returned when the assets cannot be cheaply derived from the
+    mosaic's tiles, e.g. for backends which do not store them in the mosaic document (DynamoDB, SQLite)
+    or when the requested TMS is not the mosaic's TMS.
+
+    """
+    mosaic_def = src_dst.mosaic_def
+    mosaic_tms = mosaic_def.tilematrixset or WEB_MERCATOR_TMS
+    if not mosaic_def.tiles or src_dst.tms != mosaic_tms or z < src_dst.quadkey_zoom:
+        return None
+
+    quadkey = src_dst.find_quadkeys(Tile(x=x, y=y, z=z), src_dst.quadkey_zoom)[0]
+    return mosaic_def.tiles.get(quadkey, [])
+
+
+def _tile_etag(request: Request, mosaic_def: MosaicJSON, assets: Sequence[str]) -> str:
+    """Create a (strong) ETag from the mosaic version/asset prefix, the tile's assets and the request path/query."""
+    key = "\n".join(
+        [
+            mosaic_def.version,
+            mosaic_def.asset_prefix or "",
+            *assets,
+            request.url.path,
+            request.url.query,
+        ]
+    )
+    return '"{}"'.format(hashlib.blake2b(key.encode(), digest_size=16).hexdigest())
+
+
+def _etag_match(etag: str, if_none_match: Optional[str]) -> bool:
+    """Check if an ETag matches the `If-None-Match` header value."""
+    if not if_none_match:
+        return False
+
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
 @dataclass
 class MosaicTilerFactory(BaseTilerFactory):
     """
@@ -120,7 +170,12 @@ class MosaicTilerFactory(BaseTilerFactory):
                     reader_options={**reader_params},
                     **backend_params,
                 ) as src_dst:
-                    return src_dst.mosaic_def
+                    # The mosaic definition is already validated by the backend,
+                    # skip FastAPI's `response_model` validation/serialization round trip
+                    return Response(
+                        src_dst.mosaic_def.model_dump_json(exclude_none=True),
+                        media_type="application/json",
+                    )
 
     ############################################################################
     # /bounds
@@ -230,7 +285,8 @@ class MosaicTilerFactory(BaseTilerFactory):
             "/tiles/{tileMatrixSetId}/{z}/{x}/{y}@{scale}x.{format}",
             **img_endpoint_params,
         )
-        def tile(
+        def tile(  # noqa: C901
+            request: Request,
             z: Annotated[
                 int,
                 Path(
@@ -295,13 +351,6 @@ class MosaicTilerFactory(BaseTilerFactory):
                     f"Invalid 'scale' parameter: {scale}. Scale HAVE TO be between 1 and 4",
                 )
 
-            threads = int(os.getenv("MOSAIC_CONCURRENCY", MAX_THREADS))
-
-            strict_zoom = str(os.getenv("MOSAIC_STRICT_ZOOM", False)).lower() in [
-                "true",
-                "yes",
-            ]
-
             tms = self.supported_tms.get(tileMatrixSetId)
             with rasterio.Env(**env):
                 with self.reader(
@@ -312,19 +361,36 @@ class MosaicTilerFactory(BaseTilerFactory):
                     **backend_params,
                 ) as src_dst:
 
-                    if strict_zoom and (z < src_dst.minzoom or z > src_dst.maxzoom):
+                    if MOSAIC_STRICT_ZOOM and (
+                        z < src_dst.minzoom or z > src_dst.maxzoom
+                    ):
                         raise HTTPException(
                             400,
                             f"Invalid ZOOM level {z}. Should be between {src_dst.minzoom} and {src_dst.maxzoom}",
                         )
 
+                    tile_assets = _tile_assets(src_dst, x, y, z)
+
+                    # Return `304 Not Modified` if the client already has the tile
+                    # Note: tiles without assets go through `src_dst.tile` to raise `NoAssetFoundError`
+                    etag = None
+                    if tile_assets:
+                        etag = _tile_etag(request, src_dst.mosaic_def, tile_assets)
+                        if _etag_match(etag, request.headers.get("if-none-match")):
+                            return Response(status_code=304, headers={"ETag": etag})
+
+                    # Avoid the ThreadPool overhead when the tile is made of only one asset
+                    tile_threads = MOSAIC_THREADS
+                    if tile_assets is not None and len(tile_assets) <= 1:
+                        tile_threads = 0
+
                     image, assets = src_dst.tile(
                         x,
                         y,
                         z,
                         pixel_selection=pixel_selection,
                         tilesize=scale * 256,
-                        threads=threads,
+                        threads=tile_threads,
                         buffer=buffer,
                         **layer_params,
                         **dataset_params,
@@ -343,7 +409,9 @@ class MosaicTilerFactory(BaseTilerFactory):
                 image = image.apply_colormap(colormap)
 
             if not format:
-                format = ImageType.jpeg if image.mask.all() else ImageType.png
+                # Same as `image.mask.all()` but without creating the uint8 mask array
+                masked_pixels = numpy.logical_and.reduce(image.array.mask)
+                format = ImageType.png if masked_pixels.any() else ImageType.jpeg
 
             content = image.render(
                 img_format=format.driver,
@@ -352,6 +420,9 @@ class MosaicTilerFactory(BaseTilerFactory):
             )
 
             headers: Dict[str, str] = {}
+            if etag:
+                headers["ETag"] = etag
+
             if OptionalHeader.x_assets in self.optional_headers:
                 headers["X-Assets"] = ",".join(assets)
 
@@ -552,6 +623,30 @@ class MosaicTilerFactory(BaseTilerFactory):
     def wmts(self):  # noqa: C901
         """Add wmts endpoint."""
 
+        @lru_cache(maxsize=64)
+        def _tile_matrices(
+            tileMatrixSetId: str, minzoom: int, maxzoom: int
+        ) -> Tuple[str, ...]:
+            """Return the WMTS TileMatrix elements for a TileMatrixSet and a zoom range."""
+            tms = self.supported_tms.get(tileMatrixSetId)
+
+            tileMatrix = []
+            for zoom in range(minzoom, maxzoom + 1):
+                matrix = tms.matrix(zoom)
+                tm = f"""
+                        <TileMatrix>
+                            <ows:Identifier>{matrix.id}</ows:Identifier>
+                            <ScaleDenominator>{matrix.scaleDenominator}</ScaleDenominator>
+                            <TopLeftCorner>{matrix.pointOfOrigin[0]} {matrix.pointOfOrigin[1]}</TopLeftCorner>
+                            <TileWidth>{matrix.tileWidth}</TileWidth>
+                            <TileHeight>{matrix.tileHeight}</TileHeight>
+                            <MatrixWidth>{matrix.matrixWidth}</MatrixWidth>
+                            <MatrixHeight>{matrix.matrixHeight}</MatrixHeight>
+                        </TileMatrix>"""
+                tileMatrix.append(tm)
+
+            return tuple(tileMatrix)
+
         @self.router.get("/WMTSCapabilities.xml", response_class=XMLResponse)
         @self.router.get(
             "/{tileMatrixSetId}/WMTSCapabilities.xml", response_class=XMLResponse
@@ -648,20 +743,7 @@ class MosaicTilerFactory(BaseTilerFactory):
                     minzoom = minzoom if minzoom is not None else src_dst.minzoom
                     maxzoom = maxzoom if maxzoom is not None else src_dst.maxzoom
 
-            tileMatrix = []
-            for zoom in range(minzoom, maxzoom + 1):  # type: ignore
-                matrix = tms.matrix(zoom)
-                tm = f"""
-                        <TileMatrix>
-                            <ows:Identifier>{matrix.id}</ows:Identifier>
-                            <ScaleDenominator>{matrix.scaleDenominator}</ScaleDenominator>
-                            <TopLeftCorner>{matrix.pointOfOrigin[0]} {matrix.pointOfOrigin[1]}</TopLeftCorner>
-                            <TileWidth>{matrix.tileWidth}</TileWidth>
-                            <TileHeight>{matrix.tileHeight}</TileHeight>
-                            <MatrixWidth>{matrix.matrixWidth}</MatrixWidth>
-                            <MatrixHeight>{matrix.matrixHeight}</MatrixHeight>
-                        </TileMatrix>"""
-                tileMatrix.append(tm)
+            tileMatrix = _tile_matrices(tileMatrixSetId, minzoom, maxzoom)
 
             return self.templates.TemplateResponse(
                 "wmts.xml",
@@ -703,8 +785,6 @@ class MosaicTilerFactory(BaseTilerFactory):
             env=Depends(self.environment_dependency),
         ):
             """Get Point value for a Mosaic."""
-            threads = int(os.getenv("MOSAIC_CONCURRENCY", MAX_THREADS))
-
             with rasterio.Env(**env):
                 with self.reader(
                     src_path,
@@ -716,7 +796,7 @@ class MosaicTilerFactory(BaseTilerFactory):
                         lon,
                         lat,
                         coord_crs=coord_crs or WGS84_CRS,
-                        threads=threads,
+                        threads=MOSAIC_THREADS,
                         **layer_params,
                         **dataset_params,
                     )